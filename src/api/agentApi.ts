@@ -6,11 +6,16 @@ const API_BASE_URL = process.env.REACT_APP_API_BASE_URL || 'http://127.0.0.1:800
 const API_TIMEOUT = parseInt(process.env.REACT_APP_API_TIMEOUT || '30000');
 const ENVIRONMENT = process.env.REACT_APP_ENVIRONMENT || 'development';
 
-console.log(`🔧 API Configuration:`, {
-  baseURL: API_BASE_URL,
-  timeout: API_TIMEOUT,
-  environment: ENVIRONMENT
-});
+// only log request/response traffic in development, full payloads are costly to format
+const DEBUG_LOGGING = ENVIRONMENT === 'development';
+
+if (DEBUG_LOGGING) {
+  console.log(`🔧 API Configuration:`, {
+    baseURL: API_BASE_URL,
+    timeout: API_TIMEOUT,
+    environment: ENVIRONMENT
+  });
+}
 
 const apiClient = axios.create({
   baseURL: API_BASE_URL,
@@ -25,7 +30,9 @@ const apiClient = axios.create({
 // request interceptor for logging
 apiClient.interceptors.request.use(
   (config) => {
-    console.log(`Making ${config.method?.toUpperCase()} request to ${config.url}`);
+    if (DEBUG_LOGGING) {
+      console.log(`Making ${config.method?.toUpperCase()} request to ${config.url}`);
+    }
     return config;
   },
   (error) => {
@@ -37,7 +44,9 @@ apiClient.interceptors.request.use(
 // response interceptor for error handling
 apiClient.interceptors.response.use(
   (response) => {
-    console.log('Response received:', response.data);
+    if (DEBUG_LOGGING) {
+      console.log('Response received:', response.data);
+    }
     return response;
   },
   (error) => {